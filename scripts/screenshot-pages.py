@@ -1,58 +1,185 @@
 #!/usr/bin/env python3
-"""Take screenshots of key pages for visual review"""
+"""Take screenshots of key pages for visual review
 
-from playwright.sync_api import sync_playwright
+Authenticated pages are captured in parallel by several browser contexts
+that share the signed-in session.
+
+Usage:
+    python3 scripts/screenshot-pages.py [--no-cache]
+
+Set PW_BROWSER_WS (e.g. ws://localhost:4444/) to reuse a running
+`npx playwright run-server` instead of launching a browser.
+"""
+
+from playwright.async_api import async_playwright
+from playwright.async_api import TimeoutError as PlaywrightTimeoutError
+import argparse
+import asyncio
 import os
+import time
 
 BASE_URL = "http://localhost:3001"
 DEV_EMAIL = "demo@privacysuite.example"
 OUTPUT_DIR = "/tmp/privacy-suite-screenshots"
+AUTH_STATE_PATH = "/tmp/privacy-suite-auth.json"  # Shared with verify-app.py
+AUTH_STATE_MAX_AGE = 60 * 60  # Re-authenticate when the cached session is older than this (seconds)
+VIEWPORT = {"width": 1920, "height": 1080}
+WORKER_COUNT = 4  # Parallel browser contexts used for screenshots
+ANCHOR_TIMEOUT = 10000  # ms to wait for a page's data before capturing it anyway
 
+# (route, output name, selector that marks the page's data as rendered)
+# List pages wait for a seeded demo row; dashboard and detail pages only render
+# their h1 once the tRPC query has resolved.
 PAGES_TO_SCREENSHOT = [
-    ("/sign-in", "01-sign-in"),
-    ("/privacy", "02-dashboard"),
-    ("/privacy/data-inventory", "03-data-inventory"),
-    ("/privacy/data-inventory/demo-asset-customer-db", "04-asset-detail"),
-    ("/privacy/dsar", "05-dsar-list"),
-    ("/privacy/dsar/demo-dsar-completed", "06-dsar-detail"),
-    ("/privacy/assessments", "07-assessments"),
-    ("/privacy/assessments/demo-assessment-completed", "08-assessment-detail"),
-    ("/privacy/incidents", "09-incidents"),
-    ("/privacy/incidents/demo-incident-closed", "10-incident-detail"),
-    ("/privacy/vendors", "11-vendors"),
-    ("/privacy/vendors/demo-vendor-aws", "12-vendor-detail"),
-    ("/dsar/demo", "13-public-dsar-form"),
+    ("/sign-in", "01-sign-in", "h1"),
+    ("/privacy", "02-dashboard", "h1"),
+    ("/privacy/data-inventory", "03-data-inventory", 'a[href^="/privacy/data-inventory/demo-"]'),
+    ("/privacy/data-inventory/demo-asset-customer-db", "04-asset-detail", "h1"),
+    ("/privacy/dsar", "05-dsar-list", 'a[href^="/privacy/dsar/demo-"]'),
+    ("/privacy/dsar/demo-dsar-completed", "06-dsar-detail", "h1"),
+    ("/privacy/assessments", "07-assessments", 'a[href^="/privacy/assessments/demo-"]'),
+    ("/privacy/assessments/demo-assessment-completed", "08-assessment-detail", "h1"),
+    ("/privacy/incidents", "09-incidents", 'a[href^="/privacy/incidents/demo-"]'),
+    ("/privacy/incidents/demo-incident-closed", "10-incident-detail", "h1"),
+    ("/privacy/vendors", "11-vendors", 'a[href^="/privacy/vendors/demo-"]'),
+    ("/privacy/vendors/demo-vendor-aws", "12-vendor-detail", "h1"),
+    ("/dsar/demo", "13-public-dsar-form", "h1"),
 ]
 
-os.makedirs(OUTPUT_DIR, exist_ok=True)
-
-with sync_playwright() as p:
-    browser = p.chromium.launch(headless=True)
-    page = browser.new_page(viewport={"width": 1920, "height": 1080})
-
-    # Screenshot sign-in first
-    page.goto(f"{BASE_URL}/sign-in", wait_until="networkidle")
-    page.screenshot(path=f"{OUTPUT_DIR}/01-sign-in.png", full_page=True)
-    print("✓ 01-sign-in")
-
-    # Authenticate
-    dev_email_input = page.locator("#dev-email")
-    if dev_email_input.is_visible():
-        dev_email_input.fill(DEV_EMAIL)
-        page.locator('button:has-text("Dev Sign In")').click()
-        page.wait_for_timeout(2000)
-        page.wait_for_load_state("networkidle")
-
-    # Screenshot authenticated pages
-    for route, name in PAGES_TO_SCREENSHOT[1:]:
-        if route.startswith("/dsar/") and not route.startswith("/dsar/demo-"):
-            # Public page, no auth needed
-            pass
-        page.goto(f"{BASE_URL}{route}", wait_until="networkidle")
-        page.wait_for_timeout(500)
-        page.screenshot(path=f"{OUTPUT_DIR}/{name}.png", full_page=True)
-        print(f"✓ {name}")
-
-    browser.close()
-
-print(f"\nScreenshots saved to {OUTPUT_DIR}/")
+
+async def wait_for_anchor(page, name, anchor_selector):
+    """Wait for the page's anchor, logging (not failing) when it never renders"""
+    try:
+        await page.wait_for_selector(anchor_selector, state="visible", timeout=ANCHOR_TIMEOUT)
+    except PlaywrightTimeoutError:
+        print(f"! {name}: {anchor_selector} not rendered within {ANCHOR_TIMEOUT}ms, capturing anyway")
+
+
+async def screenshot(page, name):
+    """Save a full-page screenshot without waiting on CSS animations or the caret"""
+    try:
+        await page.screenshot(
+            path=f"{OUTPUT_DIR}/{name}.png",
+            full_page=True,
+            animations="disabled",
+            caret="hide",
+        )
+    except Exception as e:
+        print(f"✗ {name}: {e}")
+        return
+    print(f"✓ {name}")
+
+
+async def restore_session(browser, use_cache):
+    """Return a page in a context restored from the cached session, or None if it is stale"""
+    if not use_cache or not os.path.exists(AUTH_STATE_PATH):
+        return None
+    if time.time() - os.path.getmtime(AUTH_STATE_PATH) > AUTH_STATE_MAX_AGE:
+        return None
+
+    context = await browser.new_context(storage_state=AUTH_STATE_PATH, viewport=VIEWPORT)
+    page = await context.new_page()
+
+    # Probe a protected route; an expired session is redirected to sign-in
+    try:
+        await page.goto(f"{BASE_URL}/privacy", wait_until="domcontentloaded")
+        await page.wait_for_selector("h1", state="visible", timeout=10000)
+    except Exception:
+        await context.close()
+        return None
+    if "/sign-in" in page.url:
+        await context.close()
+        return None
+    return page
+
+
+async def screenshot_worker(browser, storage_state, pages):
+    """Capture a share of the authenticated pages in its own context
+
+    Two tabs are used in turn so one can navigate while the other's
+    screenshot is still encoding.
+    """
+    context = await browser.new_context(storage_state=storage_state, viewport=VIEWPORT)
+    pending = [None, None]  # In-flight screenshot task per tab
+    try:
+        tabs = [await context.new_page(), await context.new_page()]
+
+        for i, (route, name, anchor_selector) in enumerate(pages):
+            slot = i % len(tabs)
+            page = tabs[slot]
+            if pending[slot]:
+                await pending[slot]  # Don't navigate away mid-capture
+                pending[slot] = None
+            try:
+                await page.goto(f"{BASE_URL}{route}", wait_until="domcontentloaded")
+            except Exception as e:
+                print(f"✗ {name}: {e}")
+                continue
+            await wait_for_anchor(page, name, anchor_selector)
+            pending[slot] = asyncio.create_task(screenshot(page, name))
+    finally:
+        await asyncio.gather(*(task for task in pending if task))
+        await context.close()
+
+
+async def main(use_cache):
+    os.makedirs(OUTPUT_DIR, exist_ok=True)
+
+    async with async_playwright() as p:
+        ws_endpoint = os.environ.get("PW_BROWSER_WS")
+        if ws_endpoint:
+            browser = await p.chromium.connect(ws_endpoint)
+        else:
+            browser = await p.chromium.launch(headless=True)
+        page = await browser.new_page(viewport=VIEWPORT)
+
+        # Screenshot sign-in first
+        route, name, anchor_selector = PAGES_TO_SCREENSHOT[0]
+        await page.goto(f"{BASE_URL}{route}", wait_until="domcontentloaded")
+        await wait_for_anchor(page, name, anchor_selector)
+        await screenshot(page, name)
+
+        # Authenticate, reusing the cached session when possible
+        cached_page = await restore_session(browser, use_cache)
+        if cached_page:
+            page = cached_page
+            print("✓ Reused cached session")
+        else:
+            dev_email_input = page.locator("#dev-email")
+            if await dev_email_input.is_visible():
+                await dev_email_input.fill(DEV_EMAIL)
+                await page.locator('button:has-text("Dev Sign In")').click()
+                try:
+                    await page.wait_for_url(lambda url: "/privacy" in url, timeout=10000)
+                except PlaywrightTimeoutError:
+                    pass  # Judged by the URL check below
+
+                if "/privacy" in page.url:
+                    await page.context.storage_state(path=AUTH_STATE_PATH)
+                else:
+                    print(f"✗ Dev sign-in failed (still on {page.url}); authenticated pages will show sign-in")
+            else:
+                print("✗ Dev sign-in form not found; authenticated pages will show sign-in")
+
+        # Screenshot authenticated pages, split round-robin across workers
+        storage_state = await page.context.storage_state()
+        pages = PAGES_TO_SCREENSHOT[1:]
+        results = await asyncio.gather(*(
+            screenshot_worker(browser, storage_state, pages[i::WORKER_COUNT])
+            for i in range(WORKER_COUNT)
+        ), return_exceptions=True)
+        for result in results:
+            if isinstance(result, Exception):
+                print(f"✗ Screenshot worker failed: {result}")
+
+        await browser.close()
+
+    print(f"\nScreenshots saved to {OUTPUT_DIR}/")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Take screenshots of key pages")
+    parser.add_argument("--no-cache", action="store_true", help="Ignore the cached session and sign in again")
+    args = parser.parse_args()
+
+    asyncio.run(main(use_cache=not args.no_cache))
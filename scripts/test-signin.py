@@ -1,14 +1,23 @@
 #!/usr/bin/env python3
-"""Test the sign-in page authentication options."""
+"""Test the sign-in page authentication options.
+
+Set PW_BROWSER_WS (e.g. ws://localhost:4444/) to reuse a running
+`npx playwright run-server` instead of launching a browser.
+"""
 
 from playwright.sync_api import sync_playwright
-import time
+from playwright.sync_api import TimeoutError as PlaywrightTimeoutError
+import os
 
 PRODUCTION_URL = "https://privacysuite-ten.vercel.app"
 
 def test_signin_page():
     with sync_playwright() as p:
-        browser = p.chromium.launch(headless=True)
+        ws_endpoint = os.environ.get("PW_BROWSER_WS")
+        if ws_endpoint:
+            browser = p.chromium.connect(ws_endpoint)
+        else:
+            browser = p.chromium.launch(headless=True)
         context = browser.new_context(viewport={"width": 1280, "height": 800})
         page = context.new_page()
 
@@ -21,13 +30,18 @@ def test_signin_page():
 
         # Navigate to sign-in page
         print("1. Navigating to sign-in page...")
-        response = page.goto(f"{PRODUCTION_URL}/sign-in", wait_until="networkidle")
+        response = page.goto(f"{PRODUCTION_URL}/sign-in", wait_until="domcontentloaded")
 
         if response and response.status >= 400:
             print(f"   ERROR: Page returned status {response.status}")
             browser.close()
             return False
 
+        try:
+            page.wait_for_selector("h1", state="visible", timeout=10000)
+        except PlaywrightTimeoutError:
+            print("   Note: heading not rendered within 10s, continuing")
+
         print(f"   Status: {response.status if response else 'unknown'}")
 
         # Take screenshot
@@ -89,8 +103,11 @@ def test_signin_page():
 
         # Go back to sign-in to test email
         print("\n5. Testing email input...")
-        page.goto(f"{PRODUCTION_URL}/sign-in", wait_until="networkidle")
-        time.sleep(1)
+        page.goto(f"{PRODUCTION_URL}/sign-in", wait_until="domcontentloaded")
+        try:
+            page.wait_for_selector("input[type=email]", state="visible", timeout=10000)
+        except PlaywrightTimeoutError:
+            pass  # Reported by the visibility check below
 
         email_input = page.locator("input[type='email'], input[placeholder*='email']").first
         if email_input.is_visible():
@@ -98,6 +115,8 @@ def test_signin_page():
             print("   ✓ Email input accepts text")
             page.screenshot(path="/tmp/email-filled.png")
             print("   Screenshot saved to /tmp/email-filled.png")
+        else:
+            print("   ✗ Email input not found")
 
         # Check for console errors
         print(f"\n6. Console errors: {len(console_errors)}")
@@ -108,13 +127,13 @@ def test_signin_page():
             print("   ✓ No console errors")
 
         # List all visible buttons for debugging
+        # The sign-in page is still loaded from step 5, so read it in place
         print("\n7. All visible buttons on sign-in page:")
-        page.goto(f"{PRODUCTION_URL}/sign-in", wait_until="networkidle")
-        buttons = page.locator("button").all()
-        for btn in buttons:
-            if btn.is_visible():
-                text = btn.inner_text().strip()
-                print(f"   - {text if text else '(no text)'}")
+        button_texts = page.evaluate("""() => Array.from(document.querySelectorAll('button'))
+            .filter(b => b.checkVisibility({ visibilityProperty: true }))
+            .map(b => b.innerText.trim() || '(no text)')""")
+        for text in button_texts:
+            print(f"   - {text}")
 
         browser.close()
 
@@ -9,25 +9,51 @@ This script crawls the entire Privacy Suite application, verifying:
 4. Console errors are captured and reported
 5. HTTP errors are tracked
 
+Pages are crawled in parallel by a pool of browser contexts that share the
+authenticated session.
+
 Usage:
-    python3 scripts/verify-app.py [--headed] [--slow]
+    python3 scripts/verify-app.py [--headed] [--slow] [--workers N] [--no-cache] [--no-assets]
+                                  [--snapshot [--full-screenshots]]
+
+Set PW_BROWSER_WS to reuse a running browser server instead of launching one:
+    npx playwright run-server --port 4444 &
+    PW_BROWSER_WS=ws://localhost:4444/ python3 scripts/verify-app.py
 """
 
+import asyncio
 import json
+import os
 import sys
 import time
 import argparse
 import re
 from dataclasses import dataclass, field
 from typing import Optional
-from urllib.parse import urljoin, urlparse
-from playwright.sync_api import sync_playwright, Page, Browser, ConsoleMessage, Response
+from urllib.parse import urlparse
+from playwright.async_api import async_playwright, Page, Browser, BrowserContext, ConsoleMessage, Response
+from playwright.async_api import TimeoutError as PlaywrightTimeoutError
+
+try:
+    import orjson  # Faster report serialization when available
+except ImportError:
+    orjson = None
 
 # Configuration
 BASE_URL = "http://localhost:3001"
 DEV_EMAIL = "demo@privacysuite.example"
 SCREENSHOT_DIR = "/tmp/privacy-suite-verification"
+AUTH_STATE_PATH = "/tmp/privacy-suite-auth.json"
+AUTH_STATE_MAX_AGE = 60 * 60  # Re-authenticate when the cached session is older than this (seconds)
 MAX_PAGES = 100  # Safety limit
+MAX_CONSOLE_LOGS = 200  # Per-page cap on captured console errors/warnings
+WORKER_COUNT = 8  # Parallel browser contexts used for the crawl
+VIEWPORT = {"width": 1920, "height": 1080}
+PAGE_READY_SELECTOR = "h1, table, [data-testid='page-ready']"
+# Page content has rendered and every Loader2 spinner (tRPC query still pending) is gone
+PAGE_READY_JS = """(sel) => !!document.querySelector(sel) && !document.querySelector('.animate-spin')"""
+BROWSER_ARGS = ["--disable-dev-shm-usage", "--disable-gpu", "--no-sandbox"]
+BLOCKED_ASSETS = "**/*.{png,jpg,jpeg,webp,gif,svg,woff,woff2,ttf}"  # Skipped with --no-assets
 
 # Known routes to test (derived from Next.js app structure)
 STATIC_ROUTES = [
@@ -53,6 +79,54 @@ PUBLIC_ROUTES = [
     "/dsar/demo",  # Public DSAR submission for demo org
 ]
 
+# List pages used to discover detail routes: (list route, href substrings that aren't detail pages)
+DYNAMIC_ROUTE_SOURCES = [
+    ("/privacy/data-inventory", ("/new", "/processing")),
+    ("/privacy/dsar", ("/settings",)),
+    ("/privacy/assessments", ("/new", "/templates")),
+    ("/privacy/incidents", ("/new",)),
+    ("/privacy/vendors", ("/new", "/questionnaires")),
+]
+
+# Links that never lead to a crawlable page
+SKIP_HREF_PREFIXES = ("#", "javascript:", "mailto:", "tel:")
+
+# Dynamic route placeholders (e.g. /[id]) that can't be tested without real IDs
+DYNAMIC_ROUTE_RE = re.compile(r'/\[[^\]]+\]')
+
+# Text that indicates a page rendered an error state
+ERROR_TEXT_RE = re.compile(
+    r"404|not found|error occurred|something went wrong|unhandled runtime error|application error",
+    re.IGNORECASE,
+)
+
+# Collects everything test_page inspects in a single round-trip to the browser
+PAGE_SUMMARY_JS = """() => ({
+    text: document.body ? document.body.innerText : "",
+    hasErrorOverlay: !!document.querySelector('[data-nextjs-dialog]'),
+    links: Array.from(document.querySelectorAll('a[href]'), a => a.getAttribute('href')),
+    buttonCount: document.querySelectorAll('button').length,
+    formCount: document.querySelectorAll('form').length,
+})"""
+
+# Summarizes every visible button so handlers can be checked without per-button round-trips
+BUTTON_SUMMARY_JS = """() => Array.from(document.querySelectorAll('button'))
+    .filter(b => b.checkVisibility({ visibilityProperty: true }))
+    .map(b => ({
+        text: b.innerText.trim(),
+        disabled: b.disabled,
+        hasOnclick: !!b.onclick || b.hasAttribute('onclick'),
+        inForm: !!b.closest('form'),
+        type: b.getAttribute('type'),
+        ariaLabel: b.getAttribute('aria-label'),
+        dataState: b.getAttribute('data-state'),
+    }))"""
+
+# Returns the first few hrefs matching a selector, skipping any containing an excluded substring
+LINK_HREFS_JS = """([sel, excludes]) => Array.from(document.querySelectorAll(sel), a => a.getAttribute('href'))
+    .filter(href => href && !excludes.some(ex => href.includes(ex)))
+    .slice(0, 5)"""
+
 
 @dataclass
 class PageResult:
@@ -63,7 +137,8 @@ class PageResult:
     load_time_ms: int = 0
     console_errors: list = field(default_factory=list)
     console_warnings: list = field(default_factory=list)
-    links_found: list = field(default_factory=list)
+    console_dropped: int = 0  # Errors/warnings beyond MAX_CONSOLE_LOGS
+    links_found: dict = field(default_factory=dict)  # Ordered set: unique hrefs in DOM order
     buttons_found: int = 0
     forms_found: int = 0
     error_message: Optional[str] = None
@@ -84,155 +159,211 @@ class VerificationReport:
     broken_links: list = field(default_factory=list)
 
 
+def absolute_url(href: str) -> Optional[str]:
+    """Resolve an app-relative href against BASE_URL; None for external links"""
+    if href.startswith("/") and not href.startswith("//"):
+        return BASE_URL + href
+    if href.startswith(BASE_URL):
+        return href
+    return None
+
+
+def url_path(url: str) -> str:
+    """Return the path of an app URL without a full parse"""
+    if url.startswith(BASE_URL):
+        return url[len(BASE_URL):].split("?", 1)[0].split("#", 1)[0] or "/"
+    return urlparse(url).path
+
+
+def write_json(path: str, payload):
+    """Write an indented JSON file, using orjson when it is installed"""
+    if orjson is not None:
+        with open(path, "wb") as f:
+            f.write(orjson.dumps(payload, option=orjson.OPT_INDENT_2))
+    else:
+        with open(path, "w") as f:
+            json.dump(payload, f, indent=2)
+
+
 class PrivacySuiteVerifier:
-    def __init__(self, headed: bool = False, slow_mo: int = 0):
+    def __init__(self, headed: bool = False, slow_mo: int = 0, workers: int = WORKER_COUNT,
+                 use_auth_cache: bool = True, block_assets: bool = False,
+                 snapshot: bool = False, full_screenshots: bool = False):
         self.headed = headed
         self.slow_mo = slow_mo
+        self.workers = max(1, workers)
+        self.use_auth_cache = use_auth_cache
+        self.block_assets = block_assets
+        self.snapshot = snapshot
+        self.full_screenshots = full_screenshots
         self.browser: Optional[Browser] = None
+        self.context: Optional[BrowserContext] = None
         self.page: Optional[Page] = None
         self.visited_urls: set = set()
         self.pending_urls: list = []
+        self.pending_set: set = set()
+        self.queue: Optional[asyncio.Queue] = None
+        self.lock: Optional[asyncio.Lock] = None
+        self.page_count = 0
         self.report = VerificationReport(timestamp=time.strftime("%Y-%m-%d %H:%M:%S"))
-        self.current_console_logs: list = []
-        self.current_response_status: Optional[int] = None
-
-    def setup_browser(self, playwright):
-        """Initialize browser with console and network listeners"""
-        self.browser = playwright.chromium.launch(
-            headless=not self.headed,
-            slow_mo=self.slow_mo
-        )
-        self.page = self.browser.new_page(viewport={"width": 1920, "height": 1080})
 
-        # Capture console messages
-        def on_console(msg: ConsoleMessage):
-            self.current_console_logs.append({
-                "type": msg.type,
-                "text": msg.text,
-                "location": str(msg.location) if msg.location else None
-            })
-        self.page.on("console", on_console)
-
-        # Capture response status for navigation
-        def on_response(response: Response):
-            if response.request.resource_type == "document":
-                self.current_response_status = response.status
-        self.page.on("response", on_response)
-
-    def authenticate(self) -> bool:
-        """Authenticate using dev credentials"""
+    async def setup_browser(self, playwright):
+        """Initialize browser and the primary context used for auth and discovery"""
+        ws_endpoint = os.environ.get("PW_BROWSER_WS")
+        if ws_endpoint:
+            self.browser = await playwright.chromium.connect(ws_endpoint, slow_mo=self.slow_mo)
+        else:
+            self.browser = await playwright.chromium.launch(
+                headless=not self.headed,
+                slow_mo=self.slow_mo,
+                args=BROWSER_ARGS,
+            )
+        self.context = await self.new_context()
+        self.page = await self.context.new_page()
+
+    async def new_context(self, **kwargs) -> BrowserContext:
+        """Create a browser context, skipping images and fonts when assets are blocked"""
+        context = await self.browser.new_context(viewport=VIEWPORT, **kwargs)
+        if self.block_assets:
+            await context.route(BLOCKED_ASSETS, lambda route: route.abort())
+        return context
+
+    async def restore_session(self) -> bool:
+        """Reuse a cached session if it is recent and still accepted by the app"""
+        if not self.use_auth_cache or not os.path.exists(AUTH_STATE_PATH):
+            return False
+        if time.time() - os.path.getmtime(AUTH_STATE_PATH) > AUTH_STATE_MAX_AGE:
+            return False
+
+        await self.context.close()
+        self.context = await self.new_context(storage_state=AUTH_STATE_PATH)
+        self.page = await self.context.new_page()
+
+        # Probe a protected route; an expired session is redirected to sign-in
+        try:
+            await self.page.goto(f"{BASE_URL}/privacy", wait_until="domcontentloaded")
+            await self.page.wait_for_selector("h1", state="visible", timeout=10000)
+        except Exception:
+            return False
+        return "/sign-in" not in self.page.url
+
+    async def authenticate(self) -> bool:
+        """Authenticate using a cached session, falling back to dev credentials"""
         print(f"\n🔐 Authenticating as {DEV_EMAIL}...")
 
+        if await self.restore_session():
+            print("✅ Reused cached session")
+            return True
+
         try:
-            self.page.goto(f"{BASE_URL}/sign-in", wait_until="networkidle")
-            self.page.wait_for_timeout(1000)
+            await self.page.goto(f"{BASE_URL}/sign-in", wait_until="domcontentloaded")
+            await self.page.wait_for_selector("h1", state="visible", timeout=5000)
 
             # Look for dev login form
             dev_email_input = self.page.locator("#dev-email")
-            if dev_email_input.is_visible():
-                dev_email_input.fill(DEV_EMAIL)
+            if await dev_email_input.is_visible():
+                await dev_email_input.fill(DEV_EMAIL)
 
                 # Click dev sign in button
                 dev_button = self.page.locator('button:has-text("Dev Sign In")')
-                if dev_button.is_visible():
-                    dev_button.click()
-                    self.page.wait_for_timeout(2000)
-                    self.page.wait_for_load_state("networkidle")
+                if await dev_button.is_visible():
+                    await dev_button.click()
+                    try:
+                        await self.page.wait_for_url(lambda url: "/privacy" in url, timeout=10000)
+                    except PlaywrightTimeoutError:
+                        pass  # Judged by the URL check below
 
                     # Check if we landed on the dashboard
                     current_url = self.page.url
                     if "/privacy" in current_url or "/sign-in" not in current_url:
                         print("✅ Authentication successful")
+                        await self.context.storage_state(path=AUTH_STATE_PATH)
                         return True
 
             print("❌ Dev login form not found or authentication failed")
-            self.page.screenshot(path=f"{SCREENSHOT_DIR}/auth-failed.png")
+            await self.page.screenshot(path=f"{SCREENSHOT_DIR}/auth-failed.png")
             return False
 
         except Exception as e:
             print(f"❌ Authentication error: {e}")
             return False
 
-    def test_page(self, url: str) -> PageResult:
-        """Test a single page and collect results"""
+    async def test_page(self, context: BrowserContext, url: str) -> PageResult:
+        """Test a single page in its own tab of the given context and collect results"""
         result = PageResult(url=url)
-        self.current_console_logs = []
-        self.current_response_status = None
+        console_logs = []
+        page: Optional[Page] = None
+
+        # Capture console errors and warnings; log/info/debug noise is dropped here
+        def on_console(msg: ConsoleMessage):
+            msg_type = msg.type
+            if msg_type in ("error", "warning"):
+                # Keep the earliest messages (usually the root cause) and just count the rest
+                if len(console_logs) < MAX_CONSOLE_LOGS:
+                    console_logs.append((msg_type, msg.text))
+                else:
+                    result.console_dropped += 1
+
+        # Match the final main-frame document, skipping any redirect hops
+        def is_document(response: Response) -> bool:
+            return (
+                response.request.resource_type == "document"
+                and response.frame == page.main_frame
+                and not 300 <= response.status < 400
+            )
 
         start_time = time.time()
 
         try:
+            page = await context.new_page()
+            page.on("console", on_console)
+
             # Navigate to page
-            self.page.goto(url, wait_until="networkidle", timeout=30000)
-            self.page.wait_for_timeout(500)  # Extra time for JS
+            async with page.expect_response(is_document, timeout=30000) as response_info:
+                await page.goto(url, wait_until="domcontentloaded", timeout=30000)
+            response = await response_info.value
+            await page.wait_for_load_state("load")
+            await self._wait_for_ready(page)
 
             result.load_time_ms = int((time.time() - start_time) * 1000)
-            result.http_status = self.current_response_status or 200
+            result.http_status = response.status
 
             # Check for error states
-            page_content = self.page.content().lower()
-            page_text = self.page.inner_text("body").lower() if self.page.locator("body").count() > 0 else ""
+            data = await page.evaluate(PAGE_SUMMARY_JS)
 
             # Check for common error indicators
-            error_indicators = [
-                "404",
-                "not found",
-                "error occurred",
-                "something went wrong",
-                "unhandled runtime error",
-                "application error",
-            ]
-
-            has_error = any(indicator in page_text for indicator in error_indicators)
+            has_error = bool(ERROR_TEXT_RE.search(data["text"]))
 
             # Check for Next.js error overlay
-            error_overlay = self.page.locator('[data-nextjs-dialog]')
-            if error_overlay.count() > 0:
+            if data["hasErrorOverlay"]:
                 has_error = True
                 result.error_message = "Next.js error overlay detected"
 
             # Collect console errors and warnings
-            for log in self.current_console_logs:
-                if log["type"] == "error":
-                    result.console_errors.append(log["text"])
-                elif log["type"] == "warning":
-                    result.console_warnings.append(log["text"])
+            for msg_type, text in console_logs:
+                if msg_type == "error":
+                    result.console_errors.append(text)
+                else:
+                    result.console_warnings.append(text)
 
             # Discover links on page
-            links = self.page.locator("a[href]").all()
-            for link in links:
-                try:
-                    href = link.get_attribute("href")
-                    if href and not href.startswith(("#", "javascript:", "mailto:", "tel:")):
-                        # Normalize URL
-                        if href.startswith("/"):
-                            full_url = urljoin(BASE_URL, href)
-                        elif href.startswith(BASE_URL):
-                            full_url = href
-                        else:
-                            continue  # Skip external links
-
-                        result.links_found.append(full_url)
-
-                        # Add to pending if not visited
-                        if full_url not in self.visited_urls and full_url not in self.pending_urls:
-                            # Skip dynamic routes we can't test without IDs
-                            if not re.search(r'/\[.*\]', href):
-                                self.pending_urls.append(full_url)
-                except Exception:
-                    pass
+            for href in data["links"]:
+                if href and not href.startswith(SKIP_HREF_PREFIXES):
+                    full_url = absolute_url(href)
+                    if full_url:  # Skip external links
+                        result.links_found[full_url] = None
 
             # Count interactive elements
-            result.buttons_found = self.page.locator("button").count()
-            result.forms_found = self.page.locator("form").count()
+            result.buttons_found = data["buttonCount"]
+            result.forms_found = data["formCount"]
 
             # Determine status
             if has_error or result.http_status >= 400:
                 result.status = "error"
-                result.screenshot_path = self._take_screenshot(url, "error")
+                result.screenshot_path = await self._take_screenshot(page, url, "error")
             elif result.console_errors:
                 result.status = "warning"
-                result.screenshot_path = self._take_screenshot(url, "warning")
+                result.screenshot_path = await self._take_screenshot(page, url, "warning")
             else:
                 result.status = "success"
 
@@ -240,84 +371,84 @@ class PrivacySuiteVerifier:
             result.status = "error"
             result.error_message = str(e)
             result.load_time_ms = int((time.time() - start_time) * 1000)
-            try:
-                result.screenshot_path = self._take_screenshot(url, "error")
-            except Exception:
-                pass
+            if page is not None:
+                try:
+                    result.screenshot_path = await self._take_screenshot(page, url, "error")
+                except Exception:
+                    pass
+        finally:
+            if page is not None:
+                try:
+                    await page.close()
+                except Exception:
+                    pass  # Tab may already be gone if the browser crashed
 
         return result
 
-    def _take_screenshot(self, url: str, prefix: str) -> str:
-        """Take a screenshot and return the path"""
-        import os
-        os.makedirs(SCREENSHOT_DIR, exist_ok=True)
-
+    def _add_pending(self, url: str) -> bool:
+        """Queue a URL unless it was already visited or queued; returns True if added"""
+        if url in self.visited_urls or url in self.pending_set:
+            return False
+        self.pending_set.add(url)
+        self.pending_urls.append(url)
+        if self.queue is not None:
+            self.queue.put_nowait(url)
+        return True
+
+    def _queue_links(self, result: PageResult):
+        """Queue unvisited links discovered on a page (caller holds the lock)"""
+        for full_url in result.links_found:
+            # Skip dynamic routes we can't test without IDs
+            if not DYNAMIC_ROUTE_RE.search(full_url):
+                self._add_pending(full_url)
+
+    async def _take_screenshot(self, page: Page, url: str, prefix: str) -> str:
+        """Take a screenshot (or ARIA snapshot in snapshot mode) and return the path"""
         # Create safe filename from URL
-        path_part = urlparse(url).path.replace("/", "_") or "root"
-        filename = f"{prefix}_{path_part}_{int(time.time())}.png"
-        filepath = f"{SCREENSHOT_DIR}/{filename}"
-
-        self.page.screenshot(path=filepath, full_page=True)
+        path_part = url_path(url).replace("/", "_") or "root"
+        basepath = f"{SCREENSHOT_DIR}/{prefix}_{path_part}_{int(time.time())}"
+
+        if not self.snapshot:
+            await page.screenshot(path=f"{basepath}.png", full_page=True)
+            return f"{basepath}.png"
+
+        # The accessibility tree is a few KB of YAML versus a multi-MB full-page PNG
+        filepath = f"{basepath}.aria.yml"
+        aria_snapshot = await page.locator("body").aria_snapshot()
+        with open(filepath, "w") as f:
+            f.write(aria_snapshot)
+        if self.full_screenshots:
+            await page.screenshot(path=f"{basepath}.png", full_page=True)
         return filepath
 
-    def test_dynamic_routes(self):
+    async def _wait_for_ready(self, page: Page, selector: str = PAGE_READY_SELECTOR, timeout: int = 10000):
+        """Wait until the page's data has rendered, tolerating pages that never settle"""
+        try:
+            await page.wait_for_function(PAGE_READY_JS, arg=selector, timeout=timeout)
+        except PlaywrightTimeoutError:
+            pass
+
+    async def test_dynamic_routes(self):
         """Test dynamic routes using data discovered from list pages"""
         print("\n📋 Discovering dynamic content...")
 
         dynamic_routes = []
 
-        # Data Inventory - get first item
-        self.page.goto(f"{BASE_URL}/privacy/data-inventory", wait_until="networkidle")
-        self.page.wait_for_timeout(500)
-        data_links = self.page.locator('a[href*="/privacy/data-inventory/"]').all()
-        for link in data_links[:2]:
-            href = link.get_attribute("href")
-            if href and "/new" not in href and "/processing" not in href:
-                dynamic_routes.append(urljoin(BASE_URL, href))
-
-        # DSAR - get first item
-        self.page.goto(f"{BASE_URL}/privacy/dsar", wait_until="networkidle")
-        self.page.wait_for_timeout(500)
-        dsar_links = self.page.locator('a[href*="/privacy/dsar/"]').all()
-        for link in dsar_links[:2]:
-            href = link.get_attribute("href")
-            if href and "/settings" not in href:
-                dynamic_routes.append(urljoin(BASE_URL, href))
-
-        # Assessments - get first item
-        self.page.goto(f"{BASE_URL}/privacy/assessments", wait_until="networkidle")
-        self.page.wait_for_timeout(500)
-        assess_links = self.page.locator('a[href*="/privacy/assessments/"]').all()
-        for link in assess_links[:2]:
-            href = link.get_attribute("href")
-            if href and "/new" not in href and "/templates" not in href:
-                dynamic_routes.append(urljoin(BASE_URL, href))
-
-        # Incidents - get first item
-        self.page.goto(f"{BASE_URL}/privacy/incidents", wait_until="networkidle")
-        self.page.wait_for_timeout(500)
-        incident_links = self.page.locator('a[href*="/privacy/incidents/"]').all()
-        for link in incident_links[:2]:
-            href = link.get_attribute("href")
-            if href and "/new" not in href:
-                dynamic_routes.append(urljoin(BASE_URL, href))
-
-        # Vendors - get first item
-        self.page.goto(f"{BASE_URL}/privacy/vendors", wait_until="networkidle")
-        self.page.wait_for_timeout(500)
-        vendor_links = self.page.locator('a[href*="/privacy/vendors/"]').all()
-        for link in vendor_links[:2]:
-            href = link.get_attribute("href")
-            if href and "/new" not in href and "/questionnaires" not in href:
-                dynamic_routes.append(urljoin(BASE_URL, href))
+        # Take the first couple of detail links from each list page
+        for list_route, excludes in DYNAMIC_ROUTE_SOURCES:
+            selector = f'a[href*="{list_route}/"]'
+            await self.page.goto(f"{BASE_URL}{list_route}", wait_until="domcontentloaded")
+            await self._wait_for_ready(self.page)
+            hrefs = await self.page.evaluate(LINK_HREFS_JS, [selector, list(excludes)])
+            detail_urls = [absolute_url(href) for href in hrefs]
+            dynamic_routes.extend([full_url for full_url in detail_urls if full_url][:2])
 
         # Add unique routes
         for route in dynamic_routes:
-            if route not in self.visited_urls and route not in self.pending_urls:
-                self.pending_urls.append(route)
+            if self._add_pending(route):
                 print(f"  Found: {route}")
 
-    def test_button_functionality(self):
+    async def test_button_functionality(self):
         """Test that buttons on key pages have proper handlers"""
         print("\n🔘 Testing button functionality...")
 
@@ -331,40 +462,81 @@ class PrivacySuiteVerifier:
 
         for route in test_pages:
             url = f"{BASE_URL}{route}"
-            self.page.goto(url, wait_until="networkidle")
-            self.page.wait_for_timeout(500)
+            await self.page.goto(url, wait_until="domcontentloaded")
+            await self._wait_for_ready(self.page, "h1")
 
-            buttons = self.page.locator("button:visible").all()
-            for i, button in enumerate(buttons):
-                try:
-                    text = button.inner_text().strip()
-                    is_disabled = button.is_disabled()
+            buttons = await self.page.evaluate(BUTTON_SUMMARY_JS)
+            for button in buttons:
+                # Skip if disabled or has proper setup
+                if button["disabled"] or button["hasOnclick"] or button["inForm"] or button["type"] == "submit":
+                    continue
 
-                    # Check if button has click handler or is part of a form
-                    has_onclick = button.get_attribute("onclick")
-                    parent_form = button.locator("xpath=ancestor::form").count()
-                    has_type = button.get_attribute("type")
+                # Check for aria labels or data attributes indicating functionality
+                if not (button["ariaLabel"] or button["dataState"]):
+                    # Might be a button without proper handlers
+                    pass  # We'll rely on console errors to detect issues
+
+        return button_issues
 
-                    # Skip if disabled or has proper setup
-                    if is_disabled or has_onclick or parent_form > 0 or has_type == "submit":
+    async def _crawl_worker(self, context: BrowserContext):
+        """Pull URLs off the shared queue and test them until cancelled"""
+        while True:
+            url = await self.queue.get()
+            try:
+                async with self.lock:
+                    # Skip visited, external, and over-limit URLs
+                    if url in self.visited_urls or not url.startswith(BASE_URL) or self.page_count >= MAX_PAGES:
                         continue
+                    self.visited_urls.add(url)
+                    self.page_count += 1
+                    index = self.page_count
 
-                    # Check for aria labels or data attributes indicating functionality
-                    aria_label = button.get_attribute("aria-label")
-                    data_state = button.get_attribute("data-state")
+                try:
+                    result = await self.test_page(context, url)
+                except Exception as e:
+                    # Record the page as failed rather than losing it (and the worker)
+                    result = PageResult(url=url, status="error", error_message=str(e))
 
-                    if not (aria_label or data_state):
-                        # Might be a button without proper handlers
-                        pass  # We'll rely on console errors to detect issues
+                async with self.lock:
+                    self.report.results.append(result)
+                    self._queue_links(result)
 
-                except Exception:
-                    pass
+                print(f"  [{index}] Tested: {url.replace(BASE_URL, '')}")
+                self._print_result(result)
+            finally:
+                self.queue.task_done()
+
+    async def crawl(self):
+        """Test all pending URLs in parallel across authenticated browser contexts"""
+        self.queue = asyncio.Queue()
+        for url in self.pending_urls:
+            self.queue.put_nowait(url)
+
+        print(f"\n📄 Testing {self.queue.qsize()} pages with {self.workers} workers...")
+        contexts = [
+            await self.new_context(storage_state=AUTH_STATE_PATH)
+            for _ in range(self.workers)
+        ]
+        workers = [asyncio.create_task(self._crawl_worker(context)) for context in contexts]
 
-        return button_issues
+        try:
+            await self.queue.join()
+        finally:
+            for worker in workers:
+                worker.cancel()
+            await asyncio.gather(*workers, return_exceptions=True)
+            await asyncio.gather(*(context.close() for context in contexts))
+
+        # Keep report order stable regardless of which worker finished first
+        order = {url: i for i, url in enumerate(self.pending_urls)}
+        public_count = len(PUBLIC_ROUTES)
+        self.report.results[public_count:] = sorted(
+            self.report.results[public_count:],
+            key=lambda r: order.get(r.url, len(order)),
+        )
 
-    def run(self):
+    async def run(self):
         """Run the full verification suite"""
-        import os
         os.makedirs(SCREENSHOT_DIR, exist_ok=True)
 
         print("=" * 60)
@@ -374,8 +546,10 @@ class PrivacySuiteVerifier:
         print(f"Screenshot dir: {SCREENSHOT_DIR}")
         print(f"Headless: {not self.headed}")
 
-        with sync_playwright() as playwright:
-            self.setup_browser(playwright)
+        self.lock = asyncio.Lock()
+
+        async with async_playwright() as playwright:
+            await self.setup_browser(playwright)
 
             # Test public routes first
             print("\n📄 Testing public routes...")
@@ -383,50 +557,32 @@ class PrivacySuiteVerifier:
                 url = f"{BASE_URL}{route}"
                 if url not in self.visited_urls:
                     print(f"  Testing: {route}")
-                    result = self.test_page(url)
+                    result = await self.test_page(self.context, url)
                     self.visited_urls.add(url)
                     self.report.results.append(result)
+                    self._queue_links(result)
                     self._print_result(result)
 
             # Authenticate for protected routes
-            if not self.authenticate():
+            if not await self.authenticate():
                 print("\n❌ Cannot continue without authentication")
-                self.browser.close()
+                await self.browser.close()
                 return self.report
 
             # Add static routes to pending
             for route in STATIC_ROUTES:
-                url = f"{BASE_URL}{route}"
-                if url not in self.visited_urls:
-                    self.pending_urls.append(url)
+                self._add_pending(f"{BASE_URL}{route}")
 
             # Discover dynamic routes
-            self.test_dynamic_routes()
+            await self.test_dynamic_routes()
 
             # Test all pending URLs
-            print(f"\n📄 Testing {len(self.pending_urls)} pages...")
-            page_count = 0
-            while self.pending_urls and page_count < MAX_PAGES:
-                url = self.pending_urls.pop(0)
-
-                if url in self.visited_urls:
-                    continue
-
-                # Skip external URLs
-                if not url.startswith(BASE_URL):
-                    continue
-
-                print(f"  [{page_count + 1}] Testing: {url.replace(BASE_URL, '')}")
-                result = self.test_page(url)
-                self.visited_urls.add(url)
-                self.report.results.append(result)
-                self._print_result(result)
-                page_count += 1
+            await self.crawl()
 
             # Test button functionality
-            self.test_button_functionality()
+            await self.test_button_functionality()
 
-            self.browser.close()
+            await self.browser.close()
 
         # Compile report
         self._compile_report()
@@ -438,6 +594,8 @@ class PrivacySuiteVerifier:
         print(f"    {icon} {result.status.upper()} ({result.load_time_ms}ms)", end="")
         if result.console_errors:
             print(f" - {len(result.console_errors)} console errors", end="")
+        if result.console_dropped:
+            print(f" (+{result.console_dropped} dropped)", end="")
         if result.error_message:
             print(f" - {result.error_message[:50]}", end="")
         print()
@@ -489,31 +647,31 @@ class PrivacySuiteVerifier:
 
         # Save JSON report
         report_path = f"{SCREENSHOT_DIR}/report.json"
-        with open(report_path, "w") as f:
-            json.dump({
-                "timestamp": self.report.timestamp,
-                "summary": {
-                    "total": self.report.total_pages,
-                    "passed": self.report.pages_passed,
-                    "warnings": self.report.pages_with_warnings,
-                    "failed": self.report.pages_failed,
-                    "console_errors": self.report.total_console_errors,
-                },
-                "results": [
-                    {
-                        "url": r.url,
-                        "status": r.status,
-                        "http_status": r.http_status,
-                        "load_time_ms": r.load_time_ms,
-                        "console_errors": r.console_errors,
-                        "error_message": r.error_message,
-                        "screenshot": r.screenshot_path,
-                        "links_found": len(r.links_found),
-                        "buttons_found": r.buttons_found,
-                    }
-                    for r in self.report.results
-                ],
-            }, f, indent=2)
+        write_json(report_path, {
+            "timestamp": self.report.timestamp,
+            "summary": {
+                "total": self.report.total_pages,
+                "passed": self.report.pages_passed,
+                "warnings": self.report.pages_with_warnings,
+                "failed": self.report.pages_failed,
+                "console_errors": self.report.total_console_errors,
+            },
+            "results": [
+                {
+                    "url": r.url,
+                    "status": r.status,
+                    "http_status": r.http_status,
+                    "load_time_ms": r.load_time_ms,
+                    "console_errors": r.console_errors,
+                    "console_dropped": r.console_dropped,
+                    "error_message": r.error_message,
+                    "screenshot": r.screenshot_path,
+                    "links_found": len(r.links_found),
+                    "buttons_found": r.buttons_found,
+                }
+                for r in self.report.results
+            ],
+        })
         print(f"\n📁 Full report saved to: {report_path}")
 
         # Overall status
@@ -533,10 +691,23 @@ def main():
     parser = argparse.ArgumentParser(description="Privacy Suite Verification Agent")
     parser.add_argument("--headed", action="store_true", help="Run browser in headed mode")
     parser.add_argument("--slow", type=int, default=0, help="Slow down actions by N ms")
+    parser.add_argument("--workers", type=int, default=WORKER_COUNT, help="Number of parallel browser contexts")
+    parser.add_argument("--no-cache", action="store_true", help="Ignore the cached session and sign in again")
+    parser.add_argument("--no-assets", action="store_true", help="Skip loading images and fonts (screenshots will lack them)")
+    parser.add_argument("--snapshot", action="store_true", help="Save ARIA snapshots instead of PNGs for failing pages")
+    parser.add_argument("--full-screenshots", action="store_true", help="With --snapshot, also save full-page PNGs")
     args = parser.parse_args()
 
-    verifier = PrivacySuiteVerifier(headed=args.headed, slow_mo=args.slow)
-    verifier.run()
+    verifier = PrivacySuiteVerifier(
+        headed=args.headed,
+        slow_mo=args.slow,
+        workers=args.workers,
+        use_auth_cache=not args.no_cache,
+        block_assets=args.no_assets,
+        snapshot=args.snapshot,
+        full_screenshots=args.full_screenshots,
+    )
+    asyncio.run(verifier.run())
     success = verifier.print_report()
 
     sys.exit(0 if success else 1)